@@ -8,7 +8,37 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.chrome.options import Options
 from urllib.robotparser import RobotFileParser
+from django.conf import settings
+from dataclasses import dataclass, field
 import time
+import zlib
+
+
+# Compact record of the data extracted from a single page.
+# Page text is only kept when a search needs it, and can be stored
+# zlib-compressed (SCRAPE_COMPRESS_PAGE_TEXT) to keep large crawls small
+@dataclass(slots=True)
+class PageData:
+    title: str | None = None
+    headings: list | None = None
+    links: list | None = None
+    paragraphs: list | None = None
+    images: list | None = None
+    videos: list | None = None
+    _text: str | bytes | None = field(default=None, repr=False)
+
+    def set_full_text(self, text, compress=False):
+        if compress:
+            self._text = zlib.compress(text.encode('utf-8'))
+        else:
+            self._text = text
+
+    # Decompressed on access, so the plain string only lives while used
+    @property
+    def full_text(self):
+        if isinstance(self._text, bytes):
+            return zlib.decompress(self._text).decode('utf-8')
+        return self._text or ''
 
 
 # Fetch and parse robots.txt for a given URL
@@ -48,11 +78,14 @@ def check_robots_allowed(url):
 # Search for a phrase in page content, returns a dict 
 def search_in_content(search_query, page_data):
     
-    if not search_query or not page_data.get('full_text'):
+    if not search_query:
+        return None
+    
+    full_text = page_data.full_text
+    if not full_text:
         return None
     
     search_query_lower = search_query.lower()
-    full_text = page_data.get('full_text', '')
     text_lower = full_text.lower()
     
     # Find all occurrences
@@ -163,7 +196,9 @@ def parse_HTML(response):
         return None
     
 #Extract data from a page based on selected options
-def extract_page_data(soup, scrape_options, limits=None):
+# Full text is only stored when keep_text is set (e.g. for searching)
+def extract_page_data(soup, scrape_options, limits=None, keep_text=False,
+                      compress_text=False):
     
     if limits is None:
         limits = {
@@ -174,19 +209,21 @@ def extract_page_data(soup, scrape_options, limits=None):
             'videos': 5
         }
     
-    data = {}
+    data = PageData()
     
     if scrape_options['title']:
-        data['title'] = soup.title.string if soup.title else 'No title found'
+        title = soup.title.string if soup.title else 'No title found'
+        # Plain str so the record doesn't keep the parse tree alive
+        data.title = str(title) if title is not None else None
     
     if scrape_options['headings']:
         headings_list = soup.find_all(['h1', 'h2', 'h3'])
-        data['headings'] = [
+        data.headings = [
             h.text for h in headings_list[:limits['headings']]
         ]
     
     if scrape_options['links']:
-        data['links'] = [
+        data.links = [
             {
                 'text': a.get_text(strip=True),
                 'href': a.get('href')
@@ -195,17 +232,17 @@ def extract_page_data(soup, scrape_options, limits=None):
     
     if scrape_options['paragraphs']:
         paragraphs_list = soup.find_all('p')
-        data['paragraphs'] = [
+        data.paragraphs = [
             p.text[:100] for p in paragraphs_list[:limits['paragraphs']]
         ]
     
     if scrape_options['images']:
         images_list = soup.find_all('img', limit=limits['images'])
-        data['images'] = [img.get('src') for img in images_list]
+        data.images = [img.get('src') for img in images_list]
 
     if scrape_options['videos']:
         videos_list = soup.find_all('video', limit=limits['videos'])
-        data['videos'] = [video.get('src') for video in videos_list]
+        data.videos = [video.get('src') for video in videos_list]
 
     if scrape_options['videos']:
         # Also check for video iframes (e.g., YouTube embeds)
@@ -214,13 +251,14 @@ def extract_page_data(soup, scrape_options, limits=None):
             iframe.get('src') for iframe in iframes
             if 'youtube.com' in (iframe.get('src') or '')
         ][:limits['videos']]
-        if 'videos' in data:
-            data['videos'].extend(video_iframes)
+        if data.videos is not None:
+            data.videos.extend(video_iframes)
         else:
-            data['videos'] = video_iframes
+            data.videos = video_iframes
     
     # Store all text content for search functionality
-    data['full_text'] = soup.get_text()
+    if keep_text:
+        data.set_full_text(soup.get_text(), compress=compress_text)
     
     return data
 
@@ -267,6 +305,7 @@ def scrape(request):
         scrape_link_targets = request.POST.get('scrape_link_targets') == 'on'
         use_selenium = request.POST.get('use_selenium') == 'on'
         recursive_depth = int(request.POST.get('recursive_depth', 1))
+        compress_text = getattr(settings, 'SCRAPE_COMPRESS_PAGE_TEXT', False)
         
         # Get result limits from user input
         limits = {
@@ -317,7 +356,30 @@ def scrape(request):
                         error = "Could not parse HTML content"
                     else:
                         # Extract data from main page
-                        main_page_data = extract_page_data(soup, scrape_options, limits)
+                        main_page_data = extract_page_data(
+                            soup,
+                            scrape_options,
+                            limits,
+                            keep_text=bool(search_query),
+                            compress_text=compress_text
+                        )
+                        
+                        # Collect link targets before releasing the tree
+                        # (extra links to account for same-domain filtering)
+                        link_hrefs = []
+                        if (
+                            scrape_link_targets
+                            and scrape_options['links']
+                            and recursive_depth > 0
+                        ):
+                            link_hrefs = [
+                                link.get('href') for link in soup.find_all(
+                                    'a',
+                                    limit=limits['linked_pages'] * 2
+                                )
+                            ]
+                        soup.decompose()
+                        
                         data['main_page'] = {
                             'url': url,
                             'data': main_page_data
@@ -338,15 +400,7 @@ def scrape(request):
                         ):
                             data['linked_pages'] = []
                             
-                            # Get extra links to account for
-                            # same-domain filtering
-                            links = soup.find_all(
-                                'a',
-                                limit=limits['linked_pages'] * 2
-                            )
-                            
-                            for link in links:
-                                href = link.get('href')
+                            for href in link_hrefs:
                                 if not href:
                                     continue
                                 
@@ -380,9 +434,16 @@ def scrape(request):
                                                     extract_page_data(
                                                         linked_soup,
                                                         scrape_options,
-                                                        limits
+                                                        limits,
+                                                        keep_text=bool(
+                                                            search_query
+                                                        ),
+                                                        compress_text=(
+                                                            compress_text
+                                                        )
                                                     )
                                                 )
+                                                linked_soup.decompose()
                                                 linked_page_entry = {
                                                     'url': absolute_url,
                                                     'data': linked_page_data
@@ -126,3 +126,8 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Store scraped page text zlib-compressed to reduce memory on large crawls
+SCRAPE_COMPRESS_PAGE_TEXT = (
+    os.environ.get('SCRAPE_COMPRESS_PAGE_TEXT', 'False') == 'True'
+)